@@ -40,6 +40,9 @@ intents.guild_messages = True
 # The prefix commands are kept for potential future use or debugging
 bot = commands.Bot(command_prefix="!", intents=intents)
 
+# Embed titles of messages whose ✅ reaction marks a water delivery complete
+WATER_REQUEST_TITLES = frozenset({"💧 Water Delivery Request"})
+
 
 @bot.event
 async def on_ready():
@@ -500,7 +503,7 @@ async def on_reaction_add(reaction, user):
             message = reaction.message
             if message and message.embeds:
                 embed = message.embeds[0]
-                if embed.title and "💧 Water Delivery Request" in embed.title:
+                if embed.title in WATER_REQUEST_TITLES:
                     # Extract the requester from the embed fields
                     requester_mention = None
                     for field in embed.fields:
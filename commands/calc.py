@@ -48,7 +48,7 @@ async def calc(interaction, command_start, amount: int, use_followup: bool = Tru
     conversion_rate = await get_sand_per_melange_with_bonus()
 
     # Calculate projected melange and remaining sand
-    melange_amount, remaining_sand = await convert_sand_to_melange(amount)
+    melange_amount, remaining_sand = convert_sand_to_melange(amount)
 
     description = (
         f"Calculating for {amount:,} spice sand at a rate of "
@@ -37,7 +37,7 @@ async def sand(interaction, command_start, amount: int, use_followup: bool = Tru
     from utils.helpers import get_sand_per_melange_with_bonus
 
     conversion_rate = await get_sand_per_melange_with_bonus()
-    new_melange, remaining_sand = await convert_sand_to_melange(amount)
+    new_melange, remaining_sand = convert_sand_to_melange(amount)
 
     # Add deposit with timing
     _, add_deposit_time = await timed_database_operation(
@@ -160,7 +160,7 @@ async def split(
             )
 
         # Convert total sand to melange
-        total_melange, remaining_sand = await convert_sand_to_melange(total_sand)
+        total_melange, remaining_sand = convert_sand_to_melange(total_sand)
         conversion_rate = await get_sand_per_melange_with_bonus()
 
         # Calculate user melange distributions
@@ -0,0 +1,172 @@
+"""
+Error scenario tests written against the old asyncpg connection interface.
+
+These are quarantined here until they are updated for the ORM interface. They
+are not collected by default (see norecursedirs in pytest.ini) and every test
+is skip-marked, so they are kept for reference only.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from database_orm import Database
+from tests.fakes import AsyncCM
+
+
+class FakeConn:
+    """Minimal asyncpg-style connection serving canned fetchrow/fetch results."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def fetchrow(self, *args, **kwargs):
+        return self._rows.get("fetchrow")
+
+    async def fetch(self, *args, **kwargs):
+        return self._rows.get("fetch", [])
+
+
+# Rows returned by the mocked connection, built once at import
+_MISMATCHED_ROW = {
+    "user_id": "123456789",
+    "username": "TestUser",
+    "total_melange": 100,
+    # Missing paid_melange, created_at, last_updated
+}
+
+_MALFORMED_ROW = {
+    "user_id": None,  # None value
+    "username": "",  # Empty string
+    "total_melange": "not_a_number",  # Wrong type
+    "paid_melange": -1,  # Negative value
+}
+
+_USER_ROW = {
+    "user_id": "123456789",
+    "username": "TestUser",
+    "total_melange": 100,
+    "paid_melange": 50,
+    "created_at": "2024-01-01T00:00:00Z",
+    "last_updated": "2024-01-01T00:00:00Z",
+}
+
+
+class TestDatabaseColumnErrors:
+    """Test scenarios that previously caused 'record index out of range' errors."""
+
+    @pytest.mark.skip(
+        reason="Error scenario tests need to be updated for new ORM interface"
+    )
+    @pytest.mark.asyncio
+    async def test_schema_mismatch_handling(self, shared_mocked_db):
+        """Test handling of database schema mismatches."""
+        # Simulate a row with different column order or missing columns
+        conn = FakeConn({"fetchrow": _MISMATCHED_ROW})
+
+        with patch.object(Database, "_get_connection") as mock_get_conn:
+            mock_get_conn.return_value = AsyncCM(conn)
+
+            db = shared_mocked_db
+
+            # Should handle missing columns without crashing
+            result = await db.get_user("123456789")
+
+            if result:
+                # Should have the columns that exist
+                assert "user_id" in result
+                assert "username" in result
+                assert "total_melange" in result
+
+                # Missing columns should be handled gracefully
+                assert result.get("paid_melange") is None or isinstance(
+                    result.get("paid_melange"), int
+                )
+
+    @pytest.mark.skip(
+        reason="Error scenario tests need to be updated for new ORM interface"
+    )
+    @pytest.mark.asyncio
+    async def test_empty_database_response_handling(self, shared_mocked_db):
+        """Test handling of empty database responses."""
+        conn = FakeConn({"fetchrow": None, "fetch": []})
+
+        with patch.object(Database, "_get_connection") as mock_get_conn:
+            mock_get_conn.return_value = AsyncCM(conn)
+
+            db = shared_mocked_db
+
+            # These are independent lookups and should not raise errors
+            user_result, deposits_result = await asyncio.gather(
+                db.get_user("nonexistent"), db.get_user_deposits("nonexistent")
+            )
+            assert user_result is None
+            assert deposits_result == []
+
+    @pytest.mark.skip(
+        reason="Error scenario tests need to be updated for new ORM interface"
+    )
+    @pytest.mark.asyncio
+    async def test_database_connection_failure_handling(self, shared_mocked_db):
+        """Test handling of database connection failures."""
+        # Imported here so collecting this module doesn't pay for asyncpg
+        import asyncpg
+
+        with patch.object(Database, "_get_connection") as mock_get_conn:
+            mock_get_conn.side_effect = asyncpg.ConnectionDoesNotExistError(
+                "Connection failed"
+            )
+
+            db = shared_mocked_db
+
+            # Should raise the connection error, not a column access error
+            with pytest.raises(asyncpg.ConnectionDoesNotExistError):
+                await db.get_user("123456789")
+
+
+class TestEdgeCaseHandling:
+    """Test edge cases that could cause breakage."""
+
+    @pytest.mark.skip(
+        reason="Error scenario tests need to be updated for new ORM interface"
+    )
+    @pytest.mark.asyncio
+    async def test_database_with_malformed_data(self, shared_mocked_db):
+        """Test database operations with malformed data."""
+        # Create malformed row data
+        conn = FakeConn({"fetchrow": _MALFORMED_ROW})
+
+        with patch.object(Database, "_get_connection") as mock_get_conn:
+            mock_get_conn.return_value = AsyncCM(conn)
+
+            db = shared_mocked_db
+
+            # Should handle malformed data gracefully
+            result = await db.get_user("123456789")
+            # Should either return None or handle the malformed data
+            assert result is None or isinstance(result, dict)
+
+    @pytest.mark.skip(
+        reason="Error scenario tests need to be updated for new ORM interface"
+    )
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fan_out", [1, 10, 100])
+    async def test_concurrent_database_operations(self, shared_mocked_db, fan_out):
+        """Test concurrent database operations don't cause issues."""
+        conn = AsyncMock()
+
+        # Mock successful responses
+        conn.fetchrow.return_value = _USER_ROW
+
+        with patch.object(Database, "_get_connection") as mock_get_conn:
+            mock_get_conn.return_value = AsyncCM(conn)
+
+            db = shared_mocked_db
+
+            # Run multiple operations concurrently
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(db.get_user("123456789")) for _ in range(fan_out)
+                ]
+            results = [task.result() for task in tasks]
+            # All operations should succeed
+            assert all(result is not None for result in results)
@@ -1,45 +1,114 @@
 import pytest
 import pytest_asyncio
-import asyncio
+import copy
+from types import SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock
 
-from database_orm import Database, Base
-from sqlalchemy.ext.asyncio import create_async_engine
+from database_orm import Database
+from tests.fakes import FROZEN_TIME, FakeSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+# A single in-memory SQLite database is shared by the whole session. The
+# Database test mode uses a StaticPool, so every session reuses the same
+# connection and the schema only has to be created once.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-# This fixture will be used by all tests
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
 
+@pytest_asyncio.fixture(scope="session")
+async def _test_database_session():
+    """Create the shared in-memory database and its schema once per session."""
+    database = Database(database_url=TEST_DATABASE_URL, for_testing=True)
 
-@pytest_asyncio.fixture(scope="function")
-async def test_database():
-    """Fixture to set up and tear down the in-memory database for each test."""
-    db_url = "sqlite+aiosqlite:///:memory:"
-    database = Database(database_url=db_url, for_testing=True)
+    # The sqlite driver manages transactions itself and breaks SAVEPOINT
+    # support; hand transaction control back to SQLAlchemy.
+    @event.listens_for(database.engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(database.engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    # Create tables before each test
     await database.initialize()
 
     yield database
 
-    # Drop all tables after each test
-    async with database.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await database.engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_database(_test_database_session):
+    """Fixture providing the shared database inside a per-test transaction.
+
+    Sessions join an outer transaction and turn their commits into SAVEPOINT
+    releases, so everything a test writes is rolled back on teardown.
+    """
+    async with _test_database_session.engine.connect() as conn:
+        trans = await conn.begin()
+
+        database = copy.copy(_test_database_session)
+        database.session_factory = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        yield database
+
+        await trans.rollback()
+
+
+@pytest.fixture
+def patched_session(monkeypatch):
+    """Route Database._get_session to a FakeSession serving the given row."""
+
+    def install(row):
+        monkeypatch.setattr(Database, "_get_session", lambda self: FakeSession(row))
+
+    return install
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_mocked_db():
+    """Database for tests that mock out its sessions or connections.
+
+    The engine is never connected, so one instance is built per test process
+    (per worker under pytest-xdist) and reused by every module.
+    """
+    database = Database(database_url=TEST_DATABASE_URL, for_testing=True)
+
+    yield database
+
+    await database.engine.dispose()
 
 
-import datetime
+@pytest.fixture(scope="session")
+def _interaction_template():
+    """Build the read-only parts of an interaction once per session.
+
+    Fixtures shallow-copy this and attach their own response/followup
+    mocks; the user, guild and created_at objects are shared, so tests must
+    not mutate them.
+    """
+    return SimpleNamespace(
+        user=SimpleNamespace(
+            id=123456789,
+            display_name="TestUser",
+            mention="<@123456789>",
+            display_avatar=SimpleNamespace(url="https://example.com/avatar.png"),
+        ),
+        created_at=FROZEN_TIME,
+        guild=SimpleNamespace(id=987654321, name="TestGuild"),
+    )
 
 
 @pytest.fixture
 def mock_interaction():
     """Fixture to create a mock interaction object."""
     interaction = MagicMock()
-    interaction.created_at = datetime.datetime.now()
+    interaction.created_at = FROZEN_TIME
     interaction.user.id = "123456789"
     interaction.user.display_name = "TestUser"
     interaction.guild.id = "987654321"
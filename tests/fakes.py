@@ -0,0 +1,85 @@
+"""
+Hand-rolled fakes and fixed values shared by tests.
+"""
+
+import datetime
+
+# Frozen clock (1640995200.0) used for every interaction and row timestamp
+FROZEN_TIME = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class AsyncCM:
+    """Async context manager that yields a fixed value.
+
+    Use as the return value of a patched _get_session/_get_connection
+    instead of configuring __aenter__ on a MagicMock.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeResult:
+    """Minimal stand-in for a SQLAlchemy Result holding a single row."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+class FakeSession:
+    """Minimal async session whose queries all return the same row."""
+
+    def __init__(self, row):
+        self._row = row
+
+    async def execute(self, *args, **kwargs):
+        return FakeResult(self._row)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeDB:
+    """Hand-rolled database stub serving canned leaderboard, user and deposits.
+
+    Leaderboard lookups are recorded in ``calls`` as (method, args) tuples so
+    tests can assert on them without a Mock.
+    """
+
+    def __init__(self, leaderboard=(), user=None, deposits=(), deposits_count=None):
+        self.leaderboard = list(leaderboard)
+        self.user = user
+        self.deposits = list(deposits)
+        self.deposits_count = deposits_count
+        self.calls = []
+
+    async def get_leaderboard(self, limit=10):
+        self.calls.append(("get_leaderboard", (limit,)))
+        return self.leaderboard[:limit]
+
+    async def get_user(self, user_id):
+        return self.user
+
+    async def upsert_user(self, user_id, username):
+        pass
+
+    async def get_user_deposits_count(self, user_id):
+        if self.deposits_count is None:
+            return len(self.deposits)
+        return self.deposits_count
+
+    async def get_user_deposits(self, user_id, page=1, per_page=10):
+        start = (page - 1) * per_page
+        return self.deposits[start : start + per_page]
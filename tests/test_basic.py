@@ -3,6 +3,7 @@ Basic tests for the bot system that don't require complex mocking.
 """
 
 import pytest
+from importlib import import_module
 from unittest.mock import Mock, AsyncMock
 
 
@@ -202,9 +203,7 @@ class TestIntegrationBasics:
 
         for command_name in COMMAND_METADATA.keys():
             # Import the command function
-            command_module = __import__(
-                f"commands.{command_name}", fromlist=[command_name]
-            )
+            command_module = import_module(f"commands.{command_name}")
 
             # Look for the command function with various naming patterns
             command_func = None
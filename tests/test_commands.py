@@ -1,5 +1,6 @@
 import pytest
 import time
+from importlib import import_module
 from unittest.mock import patch, Mock, AsyncMock
 
 
@@ -28,7 +29,7 @@ def mock_get_db(mocker, test_database):
 @pytest.mark.asyncio
 async def test_command_responds(mock_interaction, command_module, command_name, args):
     """Smoke test to ensure basic commands respond without errors."""
-    module = __import__(f"commands.{command_module}", fromlist=[command_name])
+    module = import_module(f"commands.{command_module}")
     command_func = getattr(module, command_name)
 
     # Use a generic send_response patch since we don't know the exact module
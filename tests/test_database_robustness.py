@@ -6,6 +6,33 @@ import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import asyncpg
 from database_orm import Database
+from tests.fakes import AsyncCM
+
+# Row contents served through Mock(side_effect=<dict>.get), built once at import
+_USER_ROW = {
+    "user_id": "123456789",
+    "username": "TestUser",
+    "total_melange": 100,
+    "paid_melange": 50,
+    "created_at": "2024-01-01T00:00:00Z",
+    "last_updated": "2024-01-01T00:00:00Z",
+}
+
+_DEPOSIT_ROW = {
+    "id": 1,
+    "user_id": "123456789",
+    "username": "TestUser",
+    "sand_amount": 1000,
+    "type": "solo",
+    "expedition_id": None,
+    "created_at": "2024-01-01T00:00:00Z",
+}
+
+_INCOMPLETE_ROW = {
+    "user_id": "123456789",
+    "username": "TestUser",
+    # Missing other columns
+}
 
 
 class TestDatabaseColumnAccess:
@@ -57,30 +84,11 @@ class TestDatabaseColumnAccess:
 
         # Mock user row with all expected columns
         user_row = Mock()
-        user_row.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "user_id": "123456789",
-                "username": "TestUser",
-                "total_melange": 100,
-                "paid_melange": 50,
-                "created_at": "2024-01-01T00:00:00Z",
-                "last_updated": "2024-01-01T00:00:00Z",
-            }.get(key, None)
-        )
+        user_row.__getitem__ = Mock(side_effect=_USER_ROW.get)
 
         # Mock deposit row
         deposit_row = Mock()
-        deposit_row.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "id": 1,
-                "user_id": "123456789",
-                "username": "TestUser",
-                "sand_amount": 1000,
-                "type": "solo",
-                "expedition_id": None,
-                "created_at": "2024-01-01T00:00:00Z",
-            }.get(key, None)
-        )
+        deposit_row.__getitem__ = Mock(side_effect=_DEPOSIT_ROW.get)
 
         conn.fetchrow.return_value = user_row
         conn.fetch.return_value = [deposit_row]
@@ -91,12 +99,12 @@ class TestDatabaseColumnAccess:
         reason="ORM uses SQLAlchemy sessions, not raw connections - test no longer applicable"
     )
     @pytest.mark.asyncio
-    async def test_get_user_uses_column_names(self, mock_connection):
+    async def test_get_user_uses_column_names(self, mock_connection, shared_mocked_db):
         """Test that get_user method uses column names instead of positional indexing."""
         with patch.object(Database, "_get_session") as mock_get_conn:
-            mock_get_conn.return_value.__aenter__.return_value = mock_connection
+            mock_get_conn.return_value = AsyncCM(mock_connection)
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
             result = await db.get_user("123456789")
 
             # Verify the result structure matches expected column names
@@ -116,12 +124,14 @@ class TestDatabaseColumnAccess:
         reason="ORM uses SQLAlchemy sessions, not raw connections - test no longer applicable"
     )
     @pytest.mark.asyncio
-    async def test_get_user_deposits_uses_column_names(self, mock_connection):
+    async def test_get_user_deposits_uses_column_names(
+        self, mock_connection, shared_mocked_db
+    ):
         """Test that get_user_deposits method uses column names."""
         with patch.object(Database, "_get_session") as mock_get_conn:
-            mock_get_conn.return_value.__aenter__.return_value = mock_connection
+            mock_get_conn.return_value = AsyncCM(mock_connection)
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
             result = await db.get_user_deposits("123456789")
 
             # Verify the result structure
@@ -140,26 +150,20 @@ class TestDatabaseColumnAccess:
         reason="ORM uses SQLAlchemy sessions, not raw connections - test no longer applicable"
     )
     @pytest.mark.asyncio
-    async def test_database_handles_missing_columns_gracefully(self):
+    async def test_database_handles_missing_columns_gracefully(self, shared_mocked_db):
         """Test that database operations handle missing columns gracefully."""
         conn = AsyncMock()
 
         # Mock row with missing columns (simulating schema mismatch)
         incomplete_row = Mock()
-        incomplete_row.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "user_id": "123456789",
-                "username": "TestUser",
-                # Missing other columns
-            }.get(key, None)
-        )
+        incomplete_row.__getitem__ = Mock(side_effect=_INCOMPLETE_ROW.get)
 
         conn.fetchrow.return_value = incomplete_row
 
         with patch.object(Database, "_get_session") as mock_get_conn:
-            mock_get_conn.return_value.__aenter__.return_value = conn
+            mock_get_conn.return_value = AsyncCM(conn)
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
 
             # This should not raise "record index out of range" error
             # Instead, it should handle missing columns gracefully
@@ -171,7 +175,7 @@ class TestDatabaseColumnAccess:
                 pytest.fail(f"Database operation raised {type(e).__name__}: {e}")
 
     @pytest.mark.asyncio
-    async def test_database_handles_empty_results(self):
+    async def test_database_handles_empty_results(self, shared_mocked_db):
         """Test that database operations handle empty results gracefully."""
         # Mock SQLAlchemy session
         session = AsyncMock()
@@ -186,9 +190,9 @@ class TestDatabaseColumnAccess:
         deposits_result_mock.scalars.return_value.all.return_value = []
 
         with patch.object(Database, "_get_session") as mock_get_conn:
-            mock_get_conn.return_value.__aenter__.return_value = session
+            mock_get_conn.return_value = AsyncCM(session)
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
 
             # Test get_user with no results
             result = await db.get_user("nonexistent")
@@ -205,14 +209,14 @@ class TestDatabaseColumnAccess:
         reason="ORM uses SQLAlchemy sessions, not raw connections - test no longer applicable"
     )
     @pytest.mark.asyncio
-    async def test_database_handles_connection_errors(self):
+    async def test_database_handles_connection_errors(self, shared_mocked_db):
         """Test that database operations handle connection errors gracefully."""
         with patch.object(Database, "_get_session") as mock_get_conn:
             mock_get_conn.side_effect = asyncpg.ConnectionDoesNotExistError(
                 "Connection failed"
             )
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
 
             # Should raise the connection error, not a column access error
             with pytest.raises(asyncpg.ConnectionDoesNotExistError):
@@ -223,7 +227,7 @@ class TestDatabaseSchemaCompatibility:
     """Test database operations against different schema versions."""
 
     @pytest.mark.asyncio
-    async def test_user_schema_compatibility(self):
+    async def test_user_schema_compatibility(self, shared_mocked_db):
         """Test that user operations work with expected schema."""
         # Mock SQLAlchemy session
         session = AsyncMock()
@@ -245,9 +249,9 @@ class TestDatabaseSchemaCompatibility:
         session.execute = AsyncMock(return_value=result_mock)
 
         with patch.object(Database, "_get_session") as mock_get_conn:
-            mock_get_conn.return_value.__aenter__.return_value = session
+            mock_get_conn.return_value = AsyncCM(session)
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
             result = await db.get_user("123456789")
 
             # Verify all expected columns are present
@@ -263,7 +267,7 @@ class TestDatabaseSchemaCompatibility:
                 assert column in result, f"Missing expected column: {column}"
 
     @pytest.mark.asyncio
-    async def test_deposits_schema_compatibility(self):
+    async def test_deposits_schema_compatibility(self, shared_mocked_db):
         """Test that deposits operations work with expected schema."""
         # Mock SQLAlchemy session
         session = AsyncMock()
@@ -288,9 +292,9 @@ class TestDatabaseSchemaCompatibility:
         session.execute = AsyncMock(return_value=deposits_result_mock)
 
         with patch.object(Database, "_get_session") as mock_get_conn:
-            mock_get_conn.return_value.__aenter__.return_value = session
+            mock_get_conn.return_value = AsyncCM(session)
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
             result = await db.get_user_deposits("123456789")
 
             # Verify all expected columns are present
@@ -315,7 +319,7 @@ class TestDatabaseErrorHandling:
         reason="ORM uses SQLAlchemy sessions, not raw connections - test no longer applicable"
     )
     @pytest.mark.asyncio
-    async def test_database_connection_error_handling(self):
+    async def test_database_connection_error_handling(self, shared_mocked_db):
         """Test that database operations handle connection errors properly."""
         with patch.object(Database, "_get_session") as mock_get_conn:
             # Mock connection that raises an error
@@ -323,7 +327,7 @@ class TestDatabaseErrorHandling:
                 "Connection failed"
             )
 
-            db = Database("sqlite+aiosqlite:///:memory:")
+            db = shared_mocked_db
 
             # Should raise the connection error
             with pytest.raises(asyncpg.ConnectionDoesNotExistError):
@@ -336,7 +340,7 @@ class TestDatabaseErrorHandling:
         reason="ORM uses SQLAlchemy sessions, not raw connections - test no longer applicable"
     )
     @pytest.mark.asyncio
-    async def test_database_logging_on_errors(self):
+    async def test_database_logging_on_errors(self, shared_mocked_db):
         """Test that database errors are properly logged."""
         with patch.object(Database, "_get_session") as mock_get_conn:
             # Create a mock connection that raises an error during fetchrow
@@ -357,7 +361,7 @@ class TestDatabaseErrorHandling:
             mock_get_conn.return_value = MockContextManager(mock_conn)
 
             with patch("database.logger.database_operation") as mock_logger:
-                db = Database("sqlite+aiosqlite:///:memory:")
+                db = shared_mocked_db
 
                 with pytest.raises(Exception):
                     await db.get_user("123456789")
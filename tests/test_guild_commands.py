@@ -1,22 +1,25 @@
+import copy
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, MagicMock
 
 # Import the class to be tested
 from commands.guild import Guild
+from tests.fakes import FROZEN_TIME
 
 
 @pytest.fixture
-def mock_interaction():
+def mock_interaction(_interaction_template):
     """Provides a default mock interaction object."""
-    interaction = AsyncMock()
-    interaction.response = AsyncMock()
-    interaction.followup = AsyncMock()
-    # Mock the user object with required attributes
-    interaction.user = MagicMock()
-    interaction.user.id = 12345
-    interaction.user.display_name = "Test User"
-    interaction.created_at = datetime.now()  # Use a real datetime
+    interaction = copy.copy(_interaction_template)
+    # Only the acknowledgement surfaces are rebuilt; the commands always
+    # defer first, so is_done() reports True and replies go to the followup
+    interaction.response = SimpleNamespace(
+        defer=AsyncMock(),
+        send_message=AsyncMock(),
+        is_done=MagicMock(return_value=True),
+    )
+    interaction.followup = SimpleNamespace(send=AsyncMock())
     return interaction
 
 
@@ -30,12 +33,6 @@ def guild_cog(mocker):
         return result, 0.1
 
     mock_db_instance = AsyncMock()
-    mocker.patch("commands.guild.get_database", return_value=mock_db_instance)
-    mocker.patch("commands.guild.log_command_metrics")
-    mocker.patch("commands.guild.logger")
-    mocker.patch(
-        "commands.guild.timed_database_operation", side_effect=mock_timed_db_op
-    )
 
     # Create a more realistic mock for EmbedBuilder
     mock_embed_builder = MagicMock()
@@ -51,7 +48,14 @@ def guild_cog(mocker):
     mocker.patch(
         "utils.pagination_utils.build_status_embed", return_value=mock_embed_builder
     )
-    mocker.patch("commands.guild.build_status_embed", return_value=mock_embed_builder)
+    mocker.patch.multiple(
+        "commands.guild",
+        get_database=MagicMock(return_value=mock_db_instance),
+        log_command_metrics=DEFAULT,
+        logger=DEFAULT,
+        timed_database_operation=MagicMock(side_effect=mock_timed_db_op),
+        build_status_embed=MagicMock(return_value=mock_embed_builder),
+    )
 
     cog = Guild(mock_bot)
     cog.mock_db = mock_db_instance
@@ -60,12 +64,11 @@ def guild_cog(mocker):
     return cog
 
 
-@pytest.mark.asyncio
 async def test_guild_treasury_success(guild_cog, mock_interaction):
     # Given: Configure the mock database to return a specific treasury value
     guild_cog.mock_db.get_guild_treasury.return_value = {
         "total_melange": 5000,
-        "last_updated": datetime.now(),
+        "last_updated": FROZEN_TIME,
     }
 
     # When: The treasury command is executed
@@ -78,7 +81,6 @@ async def test_guild_treasury_success(guild_cog, mock_interaction):
     mock_interaction.followup.send.assert_called_once_with(embed=guild_cog.built_embed)
 
 
-@pytest.mark.asyncio
 async def test_guild_withdraw_success(guild_cog, mock_interaction):
     # Given: Configure the mock database for a successful withdrawal
     guild_cog.mock_db.get_guild_treasury.return_value = {"total_melange": 5000}
@@ -107,7 +109,6 @@ async def test_guild_withdraw_success(guild_cog, mock_interaction):
     mock_interaction.followup.send.assert_called_once_with(embed=guild_cog.built_embed)
 
 
-@pytest.mark.asyncio
 async def test_guild_withdraw_insufficient_funds(guild_cog, mock_interaction):
     # Given: Configure the mock database to have insufficient funds
     guild_cog.mock_db.get_guild_treasury.return_value = {"total_melange": 500}
@@ -131,13 +132,12 @@ async def test_guild_withdraw_insufficient_funds(guild_cog, mock_interaction):
     assert "Insufficient guild treasury funds" in sent_message
 
 
-@pytest.mark.asyncio
 async def test_guild_transactions_success(guild_cog, mock_interaction, mocker):
     """Test the guild transactions command with existing transactions."""
     # Given
     guild_cog.mock_db.get_guild_transactions_count.return_value = 1
     mock_transaction = {
-        "created_at": datetime.now(),
+        "created_at": FROZEN_TIME,
         "melange_amount": 100,
         "sand_amount": 0,
         "transaction_type": "guild_withdraw",
@@ -163,7 +163,6 @@ async def test_guild_transactions_success(guild_cog, mock_interaction, mocker):
     )
 
 
-@pytest.mark.asyncio
 async def test_guild_transactions_no_results(guild_cog, mock_interaction):
     """Test the guild transactions command with no transactions."""
     # Given
@@ -181,13 +180,12 @@ async def test_guild_transactions_no_results(guild_cog, mock_interaction):
     assert "No guild transactions found" in sent_embed.description
 
 
-@pytest.mark.asyncio
 async def test_guild_payouts_success(guild_cog, mock_interaction, mocker):
     """Test the guild payouts command with existing payouts."""
     # Given
     guild_cog.mock_db.get_melange_payouts_count.return_value = 1
     mock_payout = {
-        "created_at": datetime.now(),
+        "created_at": FROZEN_TIME,
         "melange_amount": 200,
         "username": "recipient_user",
         "admin_username": "admin_user",
@@ -210,7 +208,6 @@ async def test_guild_payouts_success(guild_cog, mock_interaction, mocker):
     )
 
 
-@pytest.mark.asyncio
 async def test_guild_payouts_no_results(guild_cog, mock_interaction):
     """Test the guild payouts command with no payouts."""
     # Given
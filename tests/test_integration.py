@@ -2,10 +2,24 @@
 Integration tests for the bot system.
 """
 
+import inspect
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import discord
-from discord.ext import commands
+import commands as command_package
+from commands import COMMAND_METADATA
+
+# (name, metadata, exported function) for every discovered command, built once
+COMMAND_ITEMS = [
+    pytest.param(name, metadata, getattr(command_package, name, None), id=name)
+    for name, metadata in COMMAND_METADATA.items()
+]
+
+# Code object of the undecorated function behind every exported command
+COMMAND_CODE = {
+    name: inspect.unwrap(func).__code__
+    for name in COMMAND_METADATA
+    if (func := getattr(command_package, name, None)) is not None
+}
 
 
 class TestBotIntegration:
@@ -14,9 +28,8 @@ class TestBotIntegration:
     @pytest.fixture
     def mock_bot(self):
         """Create a mock bot instance."""
-        bot = Mock(spec=commands.Bot)
+        bot = Mock()
         bot.tree = Mock()
-        bot.tree.command = Mock()
         bot.tree.sync = AsyncMock()
         return bot
 
@@ -51,34 +64,24 @@ class TestCommandPackageDiscovery:
 
         assert isinstance(COMMAND_METADATA, dict)
 
-    def test_all_commands_have_metadata(self):
+    @pytest.mark.parametrize("command_name,metadata,command_func", COMMAND_ITEMS)
+    def test_all_commands_have_metadata(self, command_name, metadata, command_func):
         """Test that all commands have proper metadata structure."""
-        from commands import COMMAND_METADATA
-
         required_fields = ["aliases", "description"]
 
-        for command_name, metadata in COMMAND_METADATA.items():
-            for field in required_fields:
-                assert field in metadata, f"Command {command_name} missing {field}"
-                assert (
-                    metadata[field] is not None
-                ), f"Command {command_name} has None {field}"
+        for field in required_fields:
+            assert field in metadata, f"Command {command_name} missing {field}"
+            assert (
+                metadata[field] is not None
+            ), f"Command {command_name} has None {field}"
 
-    def test_command_functions_are_callable(self):
+    @pytest.mark.parametrize("command_name,metadata,command_func", COMMAND_ITEMS)
+    def test_command_functions_are_callable(self, command_name, metadata, command_func):
         """Test that all discovered command functions are callable."""
-        import commands
-        from commands import COMMAND_METADATA
-
-        for command_name in COMMAND_METADATA.keys():
-            # Get the command function directly from the commands package
-            command_func = getattr(commands, command_name, None)
-
-            assert (
-                command_func is not None
-            ), f"Command function {command_name} not found"
-            assert callable(
-                command_func
-            ), f"Command function {command_name} is not callable"
+        assert command_func is not None, f"Command function {command_name} not found"
+        assert callable(
+            command_func
+        ), f"Command function {command_name} is not callable"
 
 
 class TestUtilityIntegration:
@@ -128,21 +131,17 @@ class TestDatabaseIntegration:
         from database_orm import Database
 
         # Check that required methods exist
-        required_methods = [
+        required_methods = {
             "initialize",
             "upsert_user",
             "add_deposit",
             "update_user_melange",
             "create_expedition",
             "reset_all_stats",
-        ]
+        }
 
-        for method_name in required_methods:
-            assert hasattr(
-                Database, method_name
-            ), f"Database missing method: {method_name}"
-            method = getattr(Database, method_name)
-            assert callable(method), f"Database.{method_name} is not callable"
+        missing = required_methods - set(dir(Database))
+        assert not missing, f"Database missing methods: {sorted(missing)}"
 
     @pytest.mark.asyncio
     async def test_database_real_operations(self, test_database):
@@ -173,8 +172,6 @@ class TestErrorHandling:
 
     def test_command_metadata_consistency(self):
         """Test that command metadata is consistent across all commands."""
-        from commands import COMMAND_METADATA
-
         # Check for duplicate command names
         command_names = list(COMMAND_METADATA.keys())
         assert len(command_names) == len(
@@ -192,35 +189,28 @@ class TestErrorHandling:
             set(non_empty_aliases)
         ), "Duplicate aliases found"
 
-    def test_command_function_signatures(self):
+    @pytest.mark.parametrize("command_name,metadata,command_func", COMMAND_ITEMS)
+    def test_command_function_signatures(self, command_name, metadata, command_func):
         """Test that command functions have consistent signatures."""
-        from commands import COMMAND_METADATA
-        import inspect
-
-        for command_name, metadata in COMMAND_METADATA.items():
-            # Import the command function
-            command_module = __import__(
-                f"commands.{command_name}", fromlist=[command_name]
-            )
-            command_func = getattr(command_module, command_name, None)
-
-            if command_func:
-                # Check that it's an async function
-                assert inspect.iscoroutinefunction(
-                    command_func
-                ), f"Command {command_name} is not async"
-
-                # Check that it takes at least interaction parameter
-                sig = inspect.signature(command_func)
-                params = list(sig.parameters.keys())
-
-                assert (
-                    "interaction" in params
-                ), f"Command {command_name} missing 'interaction' parameter"
-
-                # For decorated functions, use_followup might be in kwargs
-                # Check if it's a direct parameter or if the function accepts kwargs
-                has_use_followup = "use_followup" in params or "kwargs" in params
-                assert (
-                    has_use_followup
-                ), f"Command {command_name} missing 'use_followup' parameter or kwargs"
+        assert command_func is not None, f"Command function {command_name} not found"
+
+        # Check that it's an async function
+        assert inspect.iscoroutinefunction(
+            command_func
+        ), f"Command {command_name} is not async"
+
+        # Check that it takes at least interaction parameter
+        code = COMMAND_CODE[command_name]
+        params = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+        has_kwargs = bool(code.co_flags & inspect.CO_VARKEYWORDS)
+
+        assert (
+            "interaction" in params
+        ), f"Command {command_name} missing 'interaction' parameter"
+
+        # For decorated functions, use_followup might be in kwargs
+        # Check if it's a direct parameter or if the function accepts kwargs
+        has_use_followup = "use_followup" in params or has_kwargs
+        assert (
+            has_use_followup
+        ), f"Command {command_name} missing 'use_followup' parameter or kwargs"
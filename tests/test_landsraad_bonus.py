@@ -1,10 +1,10 @@
 """
-Tests for landsraad bonus functionality using real database.
+Tests for landsraad bonus functionality.
 """
 
 import pytest
-import pytest_asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import Mock, AsyncMock
+from utils import helpers
 from utils.helpers import (
     convert_sand_to_melange,
     get_sand_per_melange_with_bonus,
@@ -12,95 +12,73 @@ from utils.helpers import (
     is_landsraad_bonus_active,
     update_landsraad_bonus_status,
 )
-from database_orm import Database
 
 
-class TestLandsraadBonus:
-    """Test landsraad bonus conversion functionality."""
-
-    @pytest.mark.asyncio
-    async def test_convert_sand_to_melange_normal_rate(self):
-        """Test sand to melange conversion with normal rate (50:1)."""
-        with patch("utils.helpers.get_sand_per_melange_with_bonus", return_value=50.0):
-            melange, remaining = await convert_sand_to_melange(250)
-            assert melange == 5
-            assert remaining == 0
+@pytest.fixture
+def bonus_status(monkeypatch):
+    """Set the cached landsraad bonus status, restoring the cache afterwards."""
+    monkeypatch.setattr(helpers, "_landsraad_bonus_active", is_landsraad_bonus_active())
+    monkeypatch.setattr(helpers, "_sand_per_melange", helpers._sand_per_melange)
+    return update_landsraad_bonus_status
 
-    @pytest.mark.asyncio
-    async def test_convert_sand_to_melange_landsraad_rate(self):
-        """Test sand to melange conversion with landsraad bonus rate (37.5:1)."""
-        with patch("utils.helpers.get_sand_per_melange_with_bonus", return_value=37.5):
-            melange, remaining = await convert_sand_to_melange(250)
-            assert melange == 6
-            assert remaining == 25
 
-    @pytest.mark.asyncio
-    async def test_convert_sand_to_melange_exact_conversion(self):
-        """Test exact conversion with landsraad bonus rate."""
-        with patch("utils.helpers.get_sand_per_melange_with_bonus", return_value=37.5):
-            melange, remaining = await convert_sand_to_melange(75)  # 2 * 37.5
-            assert melange == 2
-            assert remaining == 0
-
-    @pytest.mark.asyncio
-    async def test_convert_sand_to_melange_small_amount(self):
-        """Test conversion with amount less than conversion rate."""
-        with patch("utils.helpers.get_sand_per_melange_with_bonus", return_value=37.5):
-            melange, remaining = await convert_sand_to_melange(30)
-            assert melange == 0
-            assert remaining == 30
+class TestLandsraadBonus:
+    """Test landsraad bonus conversion functionality."""
 
-    @pytest.mark.asyncio
-    async def test_get_sand_per_melange_with_bonus_active(self):
+    @pytest.mark.parametrize(
+        "active,amount,expected_melange,expected_remaining",
+        [
+            pytest.param(False, 250, 5, 0, id="normal_rate"),
+            pytest.param(True, 250, 6, 25, id="landsraad_rate"),
+            pytest.param(True, 75, 2, 0, id="exact_conversion"),  # 2 * 37.5
+            pytest.param(True, 30, 0, 30, id="small_amount"),
+            pytest.param(True, 113, 3, 1, id="fractional_remainder"),  # 3 * 37.5
+        ],
+    )
+    def test_convert_sand_to_melange(
+        self, bonus_status, active, amount, expected_melange, expected_remaining
+    ):
+        """Test sand to melange conversion at the normal (50:1) and landsraad (37.5:1) rates."""
+        bonus_status(active)
+        melange, remaining = convert_sand_to_melange(amount)
+        assert (melange, remaining) == (expected_melange, expected_remaining)
+
+    async def test_get_sand_per_melange_with_bonus_active(self, bonus_status):
         """Test getting conversion rate when landsraad bonus is active."""
-        with patch("utils.helpers.is_landsraad_bonus_active", return_value=True):
-            rate = await get_sand_per_melange_with_bonus()
-            assert rate == 37.5
+        bonus_status(True)
+        rate = await get_sand_per_melange_with_bonus()
+        assert rate == 37.5
 
-    @pytest.mark.asyncio
-    async def test_get_sand_per_melange_with_bonus_inactive(self):
+    async def test_get_sand_per_melange_with_bonus_inactive(self, bonus_status):
         """Test getting conversion rate when landsraad bonus is inactive."""
-        with patch("utils.helpers.is_landsraad_bonus_active", return_value=False):
-            rate = await get_sand_per_melange_with_bonus()
-            assert rate == 50.0
+        bonus_status(False)
+        rate = await get_sand_per_melange_with_bonus()
+        assert rate == 50.0
 
-    @pytest.mark.asyncio
-    async def test_initialize_bonus_status_error_fallback(self):
+    async def test_initialize_bonus_status_error_fallback(self, monkeypatch):
         """Test fallback to False when database error occurs during initialization."""
-        with patch("utils.helpers.get_database") as mock_get_db:
-            mock_db = AsyncMock()
-            mock_db.get_all_global_settings.side_effect = Exception("Database error")
-            mock_get_db.return_value = mock_db
+        mock_db = Mock()
+        mock_db.get_all_global_settings = AsyncMock(
+            side_effect=Exception("Database error")
+        )
+        monkeypatch.setattr(helpers, "get_database", lambda: mock_db)
 
-            await initialize_global_settings()
-            assert is_landsraad_bonus_active() is False
+        await initialize_global_settings()
+        assert is_landsraad_bonus_active() is False
 
-    @pytest.mark.asyncio
-    async def test_initialize_bonus_status_none_result(self):
+    async def test_initialize_bonus_status_none_result(self, monkeypatch):
         """Test handling when database returns None during initialization."""
-        with patch("utils.helpers.get_database") as mock_get_db:
-            mock_db = AsyncMock()
-            mock_db.get_all_global_settings.return_value = {}
-            mock_get_db.return_value = mock_db
-
-            await initialize_global_settings()
-            assert is_landsraad_bonus_active() is False
-
+        mock_db = Mock()
+        mock_db.get_all_global_settings = AsyncMock(return_value={})
+        monkeypatch.setattr(helpers, "get_database", lambda: mock_db)
 
-class TestDatabaseLandsraadBonus:
-    """Test database methods for landsraad bonus management with real database."""
+        await initialize_global_settings()
+        assert is_landsraad_bonus_active() is False
 
-    @pytest.mark.asyncio
-    async def test_landsraad_bonus_conversion_rates_with_cache(self, test_database):
-        """Test that landsraad bonus affects conversion rates correctly with caching."""
-        await test_database.set_global_setting("landsraad_bonus_active", "true")
-        update_landsraad_bonus_status(True)
+    async def test_landsraad_bonus_conversion_rates_with_cache(self, bonus_status):
+        """Test that toggling the cached bonus status switches the conversion rate."""
+        bonus_status(True)
+        assert await get_sand_per_melange_with_bonus() == 37.5
 
-        rate = await get_sand_per_melange_with_bonus()
-        assert rate == 37.5
-
-        await test_database.set_global_setting("landsraad_bonus_active", "false")
-        update_landsraad_bonus_status(False)
-
-        rate = await get_sand_per_melange_with_bonus()
-        assert rate == 50.0
+        bonus_status(False)
+        assert await get_sand_per_melange_with_bonus() == 50.0
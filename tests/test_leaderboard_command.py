@@ -1,51 +1,55 @@
+import copy
 import pytest
+from importlib import import_module
 from unittest.mock import AsyncMock, MagicMock
 
 # Import the function to be tested
 from commands.leaderboard import leaderboard
+from tests.fakes import FakeDB
+
+# The commands package re-exports each command function under its module's
+# name, so the module itself has to be fetched through importlib
+leaderboard_module = import_module("commands.leaderboard")
 
 
 @pytest.fixture
-def mock_interaction():
-    """Provides a default mock interaction object."""
-    interaction = AsyncMock()
-    interaction.user = MagicMock()
-    interaction.guild = MagicMock()
-    interaction.guild.name = "Test Guild"
-    interaction.guild.icon.url = "http://test.com/icon.png"
-    interaction.created_at = MagicMock()
-    # Mock the async iterator for guild members
-    interaction.guild.fetch_members.return_value = []
-    return interaction
+def mock_interaction(_interaction_template):
+    """Provides a shallow copy of the shared interaction template.
+
+    The command only reads the user and created_at, and send_response is
+    patched, so no response mocks are attached.
+    """
+    return copy.copy(_interaction_template)
 
 
 @pytest.fixture
-def leaderboard_mocks(mocker):
+def leaderboard_mocks(monkeypatch):
     """Mocks dependencies for the leaderboard command."""
-    mock_db_instance = AsyncMock()
-    mocker.patch("commands.leaderboard.get_database", return_value=mock_db_instance)
-    mocker.patch("commands.leaderboard.log_command_metrics")
+    mock_db_instance = FakeDB()
+    monkeypatch.setattr(leaderboard_module, "get_database", lambda: mock_db_instance)
+    monkeypatch.setattr(
+        leaderboard_module, "log_command_metrics", lambda *args, **kwargs: None
+    )
 
     # Mock the response sender and the embed builders
-    mock_send_response = mocker.patch(
-        "commands.leaderboard.send_response", new_callable=AsyncMock
-    )
-    mock_build_leaderboard = mocker.patch(
-        "commands.leaderboard.build_leaderboard_embed",
-        return_value=MagicMock(build=lambda: "leaderboard_embed"),
+    mock_send_response = AsyncMock()
+    mock_build_leaderboard = MagicMock(
+        return_value=MagicMock(build=lambda: "leaderboard_embed")
     )
-    mock_build_info = mocker.patch(
-        "commands.leaderboard.build_info_embed",
-        return_value=MagicMock(build=lambda: "info_embed"),
+    mock_build_info = MagicMock(return_value=MagicMock(build=lambda: "info_embed"))
+    monkeypatch.setattr(leaderboard_module, "send_response", mock_send_response)
+    monkeypatch.setattr(
+        leaderboard_module, "build_leaderboard_embed", mock_build_leaderboard
     )
+    monkeypatch.setattr(leaderboard_module, "build_info_embed", mock_build_info)
 
     # Mock the timed db operation
     async def mock_timed_db_op(name, coro_func, *args, **kwargs):
         result = await coro_func(*args, **kwargs)
         return result, 0.1
 
-    mocker.patch(
-        "commands.leaderboard.timed_database_operation", side_effect=mock_timed_db_op
+    monkeypatch.setattr(
+        leaderboard_module, "timed_database_operation", mock_timed_db_op
     )
 
     return mock_db_instance, mock_send_response, mock_build_leaderboard, mock_build_info
@@ -61,7 +65,7 @@ async def test_leaderboard_command_success(mock_interaction, leaderboard_mocks):
         {"user_id": "123", "total_melange": 1000},
         {"user_id": "456", "total_melange": 500},
     ]
-    db_mock.get_leaderboard.return_value = leaderboard_data
+    db_mock.leaderboard = leaderboard_data
 
     # When
     await leaderboard.__wrapped__(
@@ -69,7 +73,7 @@ async def test_leaderboard_command_success(mock_interaction, leaderboard_mocks):
     )
 
     # Then
-    db_mock.get_leaderboard.assert_called_once_with(5)
+    assert db_mock.calls == [("get_leaderboard", (5,))]
     build_leaderboard_mock.assert_called_once()
     build_info_mock.assert_not_called()
     send_response_mock.assert_called_once_with(
@@ -83,7 +87,6 @@ async def test_leaderboard_command_no_data(mock_interaction, leaderboard_mocks):
     db_mock, send_response_mock, build_leaderboard_mock, build_info_mock = (
         leaderboard_mocks
     )
-    db_mock.get_leaderboard.return_value = []
 
     # When
     await leaderboard.__wrapped__(
@@ -91,7 +94,7 @@ async def test_leaderboard_command_no_data(mock_interaction, leaderboard_mocks):
     )
 
     # Then
-    db_mock.get_leaderboard.assert_called_once_with(5)
+    assert db_mock.calls == [("get_leaderboard", (5,))]
     build_leaderboard_mock.assert_not_called()
     build_info_mock.assert_called_once()
     send_response_mock.assert_called_once_with(
@@ -110,7 +113,7 @@ async def test_leaderboard_invalid_limit(mock_interaction, leaderboard_mocks):
     )
 
     # Then
-    db_mock.get_leaderboard.assert_not_called()
+    assert db_mock.calls == []
     send_response_mock.assert_called_once()
     assert "Limit must be between 5 and 100" in send_response_mock.call_args.args[1]
     assert send_response_mock.call_args.kwargs["ephemeral"] is True
@@ -3,37 +3,58 @@ Tests for the refactored ledger command.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch, ANY
-from datetime import datetime
+from importlib import import_module
+from unittest.mock import patch, ANY
 
 from commands.ledger import ledger, format_deposit_item, build_ledger_embed
 from utils.pagination_utils import PaginatedView
+from tests.fakes import FROZEN_TIME, FakeDB
+
+# The commands package shadows commands.ledger with the exported function
+ledger_module = import_module("commands.ledger")
+
+# Canned user and deposit rows served by the fake database, built once
+_USER = {
+    "user_id": "123",
+    "username": "TestUser",
+    "total_melange": 100,
+    "paid_melange": 50,
+}
+
+_DEPOSITS = [
+    {
+        "sand_amount": 100,
+        "created_at": FROZEN_TIME,
+        "type": "solo",
+        "melange_amount": 2,
+    }
+]
 
 
 @pytest.fixture
 def mock_db():
-    """Provides a mock database object."""
-    db = AsyncMock()
-    db.get_user.return_value = {
-        "user_id": "123",
-        "username": "TestUser",
-        "total_melange": 100,
-        "paid_melange": 50,
-    }
-    return db
+    """Provides a fake database serving a single user."""
+    return FakeDB(user=_USER)
 
 
+@pytest.fixture
+def patched_db(monkeypatch, mock_db):
+    """Route the ledger command's get_database to the fake database."""
+    monkeypatch.setattr(ledger_module, "get_database", lambda: mock_db)
+    return mock_db
+
+
+@pytest.mark.usefixtures("patched_db")
 class TestLedgerCommandRefactored:
     """Test the refactored ledger command."""
 
     @pytest.mark.asyncio
     async def test_ledger_no_deposits(self, mock_interaction, mock_db):
         """Test ledger command for a user with no deposits."""
-        mock_interaction.created_at = datetime.now()
-        mock_db.get_user_deposits_count.return_value = 0
+        mock_interaction.created_at = FROZEN_TIME
+        mock_db.deposits_count = 0
 
-        with patch("commands.ledger.get_database", return_value=mock_db):
-            await ledger(mock_interaction)
+        await ledger(mock_interaction)
 
         mock_interaction.followup.send.assert_called_once()
         sent_embed = mock_interaction.followup.send.call_args[1]["embed"]
@@ -44,21 +65,11 @@ class TestLedgerCommandRefactored:
         self, mock_interaction, mock_db
     ):
         """Test that the ledger command sends a PaginatedView when there are deposits."""
-        mock_interaction.created_at = datetime.now()
-        mock_db.get_user_deposits_count.return_value = 15
-        mock_db.get_user_deposits.return_value = [
-            {
-                "sand_amount": 100,
-                "created_at": datetime.now(),
-                "type": "solo",
-                "melange_amount": 2,
-            }
-        ]
+        mock_interaction.created_at = FROZEN_TIME
+        mock_db.deposits_count = 15
+        mock_db.deposits = _DEPOSITS
 
-        with (
-            patch("commands.ledger.get_database", return_value=mock_db),
-            patch("commands.ledger.PaginatedView", autospec=True) as MockPaginatedView,
-        ):
+        with patch("commands.ledger.PaginatedView", autospec=True) as MockPaginatedView:
             # Configure the mock instance that PaginatedView() will return
             mock_view_instance = MockPaginatedView.return_value
             mock_view_instance.total_pages = 2  # Based on 15 items / 10 per page
@@ -72,36 +83,45 @@ class TestLedgerCommandRefactored:
             total_items=15,
             fetch_data_func=ANY,  # Using ANY because the partial is hard to match
             format_embed_func=build_ledger_embed,
-            extra_embed_data={"user": await mock_db.get_user()},
+            extra_embed_data={"user": mock_db.user},
         )
         # Ensure the view instance was passed to send
         assert mock_interaction.followup.send.call_args[1]["view"] is mock_view_instance
 
-    def test_format_deposit_item(self):
+    @pytest.mark.parametrize(
+        "deposit,must_contain,must_not_contain",
+        [
+            pytest.param(
+                {
+                    "created_at": FROZEN_TIME,
+                    "sand_amount": 500,
+                    "melange_amount": 10,
+                    "type": "expedition",
+                },
+                ["**500 sand**", "**10 melange**", "🚀 Expedition"],
+                [],
+                id="expedition",
+            ),
+            pytest.param(
+                {
+                    "created_at": FROZEN_TIME,
+                    "sand_amount": 0,
+                    "melange_amount": 50,
+                    "type": "Guild",
+                },
+                ["**50 melange**", "🏛️ Guild"],
+                ["sand"],
+                id="guild",
+            ),
+        ],
+    )
+    def test_format_deposit_item(self, deposit, must_contain, must_not_contain):
         """Test the formatting of a single deposit item."""
-        deposit = {
-            "created_at": datetime.now(),
-            "sand_amount": 500,
-            "melange_amount": 10,
-            "type": "expedition",
-        }
-        formatted_str = format_deposit_item(deposit)
-        assert "**500 sand**" in formatted_str
-        assert "**10 melange**" in formatted_str
-        assert "🚀 Expedition" in formatted_str
-
-    def test_format_guild_deposit_item(self):
-        """Test the formatting of a guild deposit item."""
-        deposit = {
-            "created_at": datetime.now(),
-            "sand_amount": 0,
-            "melange_amount": 50,
-            "type": "Guild",
-        }
         formatted_str = format_deposit_item(deposit)
-        assert "sand" not in formatted_str
-        assert "**50 melange**" in formatted_str
-        assert "🏛️ Guild" in formatted_str
+        for expected in must_contain:
+            assert expected in formatted_str
+        for unexpected in must_not_contain:
+            assert unexpected not in formatted_str
 
     @pytest.mark.asyncio
     async def test_build_ledger_embed(self, mock_interaction):
@@ -110,7 +130,7 @@ class TestLedgerCommandRefactored:
         deposits = [
             {
                 "sand_amount": 100,
-                "created_at": datetime.now(),
+                "created_at": FROZEN_TIME,
                 "type": "solo",
                 "melange_amount": 2,
             }
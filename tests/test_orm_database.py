@@ -4,7 +4,6 @@ Test the SQLAlchemy ORM database implementation.
 
 import pytest
 import pytest_asyncio
-from database_orm import Database
 
 
 class TestORMDatabase:
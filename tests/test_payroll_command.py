@@ -12,100 +12,92 @@ def mock_get_db(mocker, test_database):
     )
 
 
+# (confirm, pay_all_pending_melange result, title, description text,
+#  [(field index, field attribute, text)], ephemeral)
+PAYROLL_CASES = [
+    pytest.param(False, None, "Payroll Cancelled", None, [], True, id="confirm_false"),
+    pytest.param(
+        True,
+        {
+            "users_paid": 2,
+            "total_paid": 700,
+            "paid_users": [
+                {"username": "UserA", "amount_paid": 500},
+                {"username": "UserB", "amount_paid": 200},
+            ],
+        },
+        "Guild Payroll Complete",
+        None,
+        [
+            (0, "value", "700"),
+            (1, "name", "💸 Paid Users"),
+            (1, "value", "UserA**: 500"),
+            (1, "value", "UserB**: 200"),
+        ],
+        False,
+        id="confirm_true",
+    ),
+    pytest.param(
+        True,
+        {"users_paid": 0, "total_paid": 0, "paid_users": []},
+        "Payroll Status",
+        "There are no users with pending melange to pay",
+        [],
+        False,
+        id="confirm_true_no_one_to_pay",
+    ),
+]
+
+
 class TestPayrollCommand:
+    @pytest.mark.parametrize(
+        "confirm,pay_all_return,expected_title,expected_description,"
+        "expected_fields,ephemeral",
+        PAYROLL_CASES,
+    )
     @pytest.mark.asyncio
-    async def test_payroll_confirm_false(self, mock_interaction, test_database):
-        with (
-            patch(
-                "commands.payroll.send_response", new_callable=AsyncMock
-            ) as mock_send,
-            patch.object(
-                test_database, "pay_all_pending_melange", new_callable=AsyncMock
-            ) as mock_pay_all,
-        ):
-            await payroll.__wrapped__(
-                mock_interaction, time.time(), confirm=False, use_followup=True
-            )
-            mock_pay_all.assert_not_called()
-            mock_send.assert_called_once()
-            kwargs = mock_send.call_args.kwargs
-            assert "Payroll Cancelled" in kwargs["embed"].title
-            assert kwargs["ephemeral"] is True
+    async def test_payroll(
+        self,
+        mock_interaction,
+        test_database,
+        confirm,
+        pay_all_return,
+        expected_title,
+        expected_description,
+        expected_fields,
+        ephemeral,
+    ):
+        async def timed_op_side_effect(name, coro, *args, **kwargs):
+            res = await coro(*args, **kwargs)
+            return res, 0.1
 
-    @pytest.mark.asyncio
-    async def test_payroll_confirm_true(self, mock_interaction, test_database):
         with (
             patch(
                 "commands.payroll.send_response", new_callable=AsyncMock
             ) as mock_send,
             patch.object(
-                test_database, "pay_all_pending_melange", new_callable=AsyncMock
+                test_database,
+                "pay_all_pending_melange",
+                new_callable=AsyncMock,
+                return_value=pay_all_return,
             ) as mock_pay_all,
-        ):
-            mock_pay_all.return_value = {
-                "users_paid": 2,
-                "total_paid": 700,
-                "paid_users": [
-                    {"username": "UserA", "amount_paid": 500},
-                    {"username": "UserB", "amount_paid": 200},
-                ],
-            }
-
-            async def timed_op_side_effect(name, coro, *args, **kwargs):
-                res = await coro(*args, **kwargs)
-                return res, 0.1
-
-            with patch(
+            patch(
                 "commands.payroll.timed_database_operation",
                 side_effect=timed_op_side_effect,
-            ):
-                await payroll.__wrapped__(
-                    mock_interaction, time.time(), confirm=True, use_followup=True
-                )
-            mock_pay_all.assert_called_once()
-            mock_send.assert_called_once()
-            kwargs = mock_send.call_args.kwargs
-            embed = kwargs["embed"]
-            assert "Guild Payroll Complete" in embed.title
-            assert "700" in embed.fields[0].value
-            assert "💸 Paid Users" in embed.fields[1].name
-            assert "UserA**: 500" in embed.fields[1].value
-            assert "UserB**: 200" in embed.fields[1].value
-
-    @pytest.mark.asyncio
-    async def test_payroll_confirm_true_no_one_to_pay(
-        self, mock_interaction, test_database
-    ):
-        with (
-            patch(
-                "commands.payroll.send_response", new_callable=AsyncMock
-            ) as mock_send,
-            patch.object(
-                test_database, "pay_all_pending_melange", new_callable=AsyncMock
-            ) as mock_pay_all,
+            ),
         ):
-            mock_pay_all.return_value = {
-                "users_paid": 0,
-                "total_paid": 0,
-                "paid_users": [],
-            }
+            await payroll.__wrapped__(
+                mock_interaction, time.time(), confirm=confirm, use_followup=True
+            )
 
-            async def timed_op_side_effect(name, coro, *args, **kwargs):
-                res = await coro(*args, **kwargs)
-                return res, 0.1
+        assert mock_pay_all.called is confirm
+        mock_send.assert_called_once()
+        kwargs = mock_send.call_args.kwargs
+        embed = kwargs["embed"]
+        assert expected_title in embed.title
+        assert kwargs.get("ephemeral", False) is ephemeral
 
-            with patch(
-                "commands.payroll.timed_database_operation",
-                side_effect=timed_op_side_effect,
-            ):
-                await payroll.__wrapped__(
-                    mock_interaction, time.time(), confirm=True, use_followup=True
-                )
-            mock_pay_all.assert_called_once()
-            mock_send.assert_called_once()
-            kwargs = mock_send.call_args.kwargs
-            assert "Payroll Status" in kwargs["embed"].title
-            assert (
-                "There are no users with pending melange to pay"
-                in kwargs["embed"].description
-            )
+        if expected_description is not None:
+            assert expected_description in embed.description
+        for index, attr, text in expected_fields:
+            assert text in getattr(embed.fields[index], attr)
@@ -3,15 +3,6 @@ from unittest.mock import AsyncMock, MagicMock
 from commands.pending import pending
 
 
-@pytest.fixture
-def mock_interaction():
-    """Provides a default mock interaction object."""
-    interaction = AsyncMock()
-    interaction.user = MagicMock(id=123, display_name="Test Admin")
-    interaction.created_at = MagicMock()
-    return interaction
-
-
 @pytest.fixture
 def pending_mocks(mocker):
     """Mocks dependencies for the pending command."""
@@ -5,17 +5,6 @@ from unittest.mock import AsyncMock, MagicMock
 from commands.refinery import refinery
 
 
-@pytest.fixture
-def mock_interaction():
-    """Provides a default mock interaction object."""
-    interaction = AsyncMock()
-    interaction.user = MagicMock()
-    interaction.user.id = "12345"
-    interaction.user.display_name = "Test User"
-    interaction.created_at = MagicMock()  # for timestamp fallback
-    return interaction
-
-
 @pytest.fixture
 def refinery_mocks(mocker):
     """Mocks dependencies for the refinery command."""
@@ -34,8 +34,14 @@ class TestResetCommand:
         self, mock_interaction, test_database
     ):
         mock_interaction.edit_original_response = AsyncMock()
+        # Set once the command has sent its confirmation view
+        view_sent = asyncio.Event()
         with (
-            patch("commands.reset.send_response", new_callable=AsyncMock) as mock_send,
+            patch(
+                "commands.reset.send_response",
+                new_callable=AsyncMock,
+                side_effect=lambda *args, **kwargs: view_sent.set(),
+            ) as mock_send,
             patch.object(
                 test_database, "reset_all_stats", new_callable=AsyncMock
             ) as mock_reset_stats,
@@ -54,7 +60,7 @@ class TestResetCommand:
                         mock_interaction, time.time(), confirm=True, use_followup=True
                     )
                 )
-                await asyncio.sleep(0.01)
+                await asyncio.wait_for(view_sent.wait(), timeout=1)
 
                 mock_send.assert_called_once()
                 view = mock_send.call_args.kwargs.get("view")
@@ -73,8 +79,14 @@ class TestResetCommand:
         self, mock_interaction, test_database
     ):
         mock_interaction.edit_original_response = AsyncMock()
+        # Set once the command has sent its confirmation view
+        view_sent = asyncio.Event()
         with (
-            patch("commands.reset.send_response", new_callable=AsyncMock) as mock_send,
+            patch(
+                "commands.reset.send_response",
+                new_callable=AsyncMock,
+                side_effect=lambda *args, **kwargs: view_sent.set(),
+            ) as mock_send,
             patch.object(
                 test_database, "reset_all_stats", new_callable=AsyncMock
             ) as mock_reset_stats,
@@ -85,7 +97,7 @@ class TestResetCommand:
                     mock_interaction, time.time(), confirm=True, use_followup=True
                 )
             )
-            await asyncio.sleep(0.01)
+            await asyncio.wait_for(view_sent.wait(), timeout=1)
 
             mock_send.assert_called_once()
             view = mock_send.call_args.kwargs.get("view")
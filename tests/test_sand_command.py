@@ -5,16 +5,6 @@ from unittest.mock import AsyncMock, MagicMock
 from commands.sand import sand
 
 
-@pytest.fixture
-def mock_interaction():
-    """Provides a default mock interaction object."""
-    interaction = AsyncMock()
-    interaction.user = MagicMock()
-    interaction.user.id = "12345"
-    interaction.user.display_name = "Test User"
-    return interaction
-
-
 @pytest.fixture
 def sand_mocks(mocker):
     """Mocks dependencies for the sand command."""
@@ -38,7 +28,7 @@ def sand_mocks(mocker):
         "utils.helpers.get_sand_per_melange_with_bonus", AsyncMock(return_value=50)
     )
     mocker.patch(
-        "commands.sand.convert_sand_to_melange", AsyncMock(return_value=(20, 0))
+        "commands.sand.convert_sand_to_melange", return_value=(20, 0)
     )  # melange, remaining_sand
     mocker.patch(
         "commands.sand.validate_user_exists",
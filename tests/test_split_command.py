@@ -2,8 +2,8 @@ import pytest
 from unittest.mock import patch, Mock, AsyncMock
 from commands.split import split
 from utils.helpers import get_user_cut, get_guild_cut, update_user_cut, update_guild_cut
-import datetime
 import discord
+from tests.fakes import FROZEN_TIME
 
 
 @pytest.fixture(autouse=True)
@@ -13,7 +13,7 @@ def mock_get_db(mocker, test_database):
 
 def setup_split_mock_interaction(mock_interaction):
     """Helper function to set up the mock interaction for split command tests."""
-    mock_interaction.created_at = datetime.datetime.now(datetime.timezone.utc)
+    mock_interaction.created_at = FROZEN_TIME
 
     async def mock_fetch_member(user_id):
         mock_user = Mock(spec=discord.Member)
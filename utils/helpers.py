@@ -47,6 +47,7 @@ def get_sand_per_melange() -> int:
 
 # Global variables to cache settings
 _landsraad_bonus_active = False
+_sand_per_melange: float = float(SAND_PER_MELANGE_NORMAL)
 _user_cut: Optional[int] = None
 _guild_cut: int = 10
 _region: Optional[str] = None
@@ -57,7 +58,7 @@ _user_role_ids: List[int] = []
 
 async def initialize_global_settings():
     """Called once when the bot starts up to load all global settings."""
-    global _landsraad_bonus_active, _user_cut, _guild_cut, _region, _admin_role_ids, _officer_role_ids, _user_role_ids
+    global _landsraad_bonus_active, _sand_per_melange, _user_cut, _guild_cut, _region, _admin_role_ids, _officer_role_ids, _user_role_ids
     logger.info("Initializing global settings from database...")
     try:
         db = get_database()
@@ -68,6 +69,7 @@ async def initialize_global_settings():
         _landsraad_bonus_active = (
             landsraad_status_str is not None and landsraad_status_str.lower() == "true"
         )
+        _sand_per_melange = _rate_for_bonus(_landsraad_bonus_active)
         logger.info(f"Initial Landsraad bonus status loaded: {_landsraad_bonus_active}")
 
         # User Cut
@@ -103,6 +105,7 @@ async def initialize_global_settings():
         logger.error(f"Error initializing global settings: {e}", exc_info=True)
         # Ensure defaults are set on error
         _landsraad_bonus_active = False
+        _sand_per_melange = _rate_for_bonus(False)
         _user_cut = None
         _guild_cut = 10
         _region = None
@@ -112,6 +115,11 @@ async def initialize_global_settings():
         logger.warning("Global settings initialization failed. Using default values.")
 
 
+def _rate_for_bonus(active: bool) -> float:
+    """Sand per melange for the given landsraad bonus status."""
+    return SAND_PER_MELANGE_LANDSRAAD if active else float(SAND_PER_MELANGE_NORMAL)
+
+
 def is_landsraad_bonus_active():
     """Reads the bonus status from the in-memory cache."""
     return _landsraad_bonus_active
@@ -119,8 +127,9 @@ def is_landsraad_bonus_active():
 
 def update_landsraad_bonus_status(new_status: bool):
     """Updates the in-memory cache."""
-    global _landsraad_bonus_active
+    global _landsraad_bonus_active, _sand_per_melange
     _landsraad_bonus_active = new_status
+    _sand_per_melange = _rate_for_bonus(new_status)
     logger.info(f"Landsraad bonus status updated in cache: {new_status}")
 
 
@@ -198,13 +207,10 @@ def update_user_roles(new_roles: List[int]):
 
 async def get_sand_per_melange_with_bonus() -> float:
     """Get the current sand to melange conversion rate, considering landsraad bonus"""
-    if is_landsraad_bonus_active():
-        return SAND_PER_MELANGE_LANDSRAAD
-    else:
-        return float(SAND_PER_MELANGE_NORMAL)
+    return _sand_per_melange
 
 
-async def convert_sand_to_melange(sand_amount: int) -> tuple[int, int]:
+def convert_sand_to_melange(sand_amount: int) -> tuple[int, int]:
     """
     Convert sand amount to melange using current conversion rate.
 
@@ -214,18 +220,12 @@ async def convert_sand_to_melange(sand_amount: int) -> tuple[int, int]:
     Returns:
         tuple: (melange_amount, remaining_sand)
     """
-    conversion_rate = await get_sand_per_melange_with_bonus()
+    # Express the cached rate as an exact sand/melange fraction (37.5 -> 75/2)
+    # so the conversion stays in integer arithmetic
+    sand_per, melange_per = _sand_per_melange.as_integer_ratio()
 
-    # Handle fractional conversion rates (like 37.5)
-    if conversion_rate == int(conversion_rate):
-        # Integer conversion rate (normal case)
-        melange_amount = sand_amount // int(conversion_rate)
-        remaining_sand = sand_amount % int(conversion_rate)
-    else:
-        # Fractional conversion rate (landsraad bonus case)
-        # Convert to integer melange and calculate remaining sand
-        melange_amount = int(sand_amount / conversion_rate)
-        remaining_sand = sand_amount - int(melange_amount * conversion_rate)
+    melange_amount = (sand_amount * melange_per) // sand_per
+    remaining_sand = sand_amount - (melange_amount * sand_per) // melange_per
 
     return melange_amount, remaining_sand
 